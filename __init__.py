@@ -1,12 +1,18 @@
-import configparser
+import hashlib
+import os
 import platform
-import shutil
+import queue
+import re
 import sqlite3
 import tempfile
 import threading
-from contextlib import contextmanager
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import ExitStack, contextmanager
+from functools import partial
 from pathlib import Path
-from typing import List, Tuple, Callable
+from typing import Dict, Iterator, List, Tuple, Callable
 from itertools import islice
 
 from albert import *
@@ -23,24 +29,31 @@ md_maintainers = ["@tomsquest"]
 md_credits = ["@stevenxxiu", "@sagebind"]
 
 
+# Path value of each [ProfileN] section in profiles.ini, the key is searched
+# up to the next line starting a section and matched case-insensitively
+_PROFILE_PATH_RE = re.compile(
+    r"^\[Profile\d+\](?:(?!^\[).)*?^[ \t]*Path[ \t]*[=:][ \t]*([^\r\n]*?)[ \t]*$",
+    re.MULTILINE | re.DOTALL | re.IGNORECASE,
+)
+
+
 def get_available_profiles(firefox_root: Path) -> List[str]:
     """Get list of available Firefox profiles from profiles.ini"""
     profiles = []
 
-    if not firefox_root.exists():
+    profiles_ini = firefox_root / "profiles.ini"
+    if not profiles_ini.exists():
         return profiles
 
     try:
-        config = configparser.ConfigParser()
-        config.read(firefox_root / "profiles.ini")
-
-        for section in config.sections():
-            if section.startswith("Profile") and "Path" in config[section]:
-                profile_path = firefox_root / config[section]["Path"]
-                if (profile_path / "places.sqlite").exists() and (
-                    profile_path / "favicons.sqlite"
-                ).exists():
-                    profiles.append(config[section]["Path"])
+        for path in _PROFILE_PATH_RE.findall(profiles_ini.read_text()):
+            if not path:
+                continue
+            profile_path = firefox_root / path
+            if (profile_path / "places.sqlite").exists() and (
+                profile_path / "favicons.sqlite"
+            ).exists():
+                profiles.append(path)
 
     except Exception as e:
         warning(f"Failed to read Firefox profiles: {str(e)}")
@@ -48,87 +61,157 @@ def get_available_profiles(firefox_root: Path) -> List[str]:
     return profiles
 
 
+def _readonly_uri(db_path: Path, immutable: bool = False) -> str:
+    """Return the SQLite URI opening db_path read-only, optionally as immutable"""
+    return f"{db_path.as_uri()}?mode=ro" + ("&immutable=1" if immutable else "")
+
+
+def _open_connection(db_path: Path, attach: Dict[str, Path], immutable: bool) -> sqlite3.Connection:
+    """Open db_path and attach further databases, all read-only"""
+    # Firefox holds an exclusive lock while running, fail right away
+    # instead of waiting for it in the busy handler
+    timeout = 5.0 if immutable else 0
+    conn = sqlite3.connect(_readonly_uri(db_path, immutable), uri=True, timeout=timeout)
+    try:
+        # Memory map the database and keep page cache and temporary
+        # sorts in memory, the queries are large sequential scans
+        conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        conn.execute("PRAGMA cache_size=-20000")  # 20 MB
+        conn.execute("PRAGMA temp_store=MEMORY")
+        # Never write to Firefox data, even if a query tried to
+        conn.execute("PRAGMA query_only=1")
+        conn.execute("SELECT count(*) FROM sqlite_master")
+        for schema, path in attach.items():
+            conn.execute(f"ATTACH DATABASE ? AS {schema}", (_readonly_uri(path, immutable),))
+            conn.execute(f"SELECT count(*) FROM {schema}.sqlite_master")
+        return conn
+    except BaseException:
+        conn.close()
+        raise
+
+
+# Databases found locked, mapped to the time of the last attempt to open them read-only
+_locked_databases: Dict[Path, float] = {}
+_LOCKED_RETRY_INTERVAL = 60.0
+
+
 @contextmanager
-def get_connection(db_path: Path):
+def get_connection(db_path: Path, attach: Dict[str, Path] | None = None):
     """Create a connection to the places database with read-only access.
 
-    Copies the database files to a temporary directory to avoid lock issues
-    when Firefox is running.
+    The database is opened read-only, which includes the transactions
+    committed to the WAL. If Firefox holds a lock preventing that, the
+    database is opened as immutable instead, which needs no locks but
+    ignores the WAL. Locked databases are opened as immutable right away
+    for a while, so repeated queries do not retry each time.
+
+    :param db_path: Path to the main database
+    :param attach: Optional mapping of schema names to databases attached
+                   to the same connection, opened the same way
     """
     if not db_path.exists():
         raise FileNotFoundError(f"Places database not found at {db_path}")
 
-    # Create a temporary directory for the database copy
-    temp_dir = tempfile.mkdtemp(prefix="albert_plugin_firefox_db_")
-    temp_dir_path = Path(temp_dir)
+    locked_since = _locked_databases.get(db_path)
+    if locked_since is not None and time.monotonic() - locked_since < _LOCKED_RETRY_INTERVAL:
+        conn = _open_connection(db_path, attach or {}, immutable=True)
+    else:
+        try:
+            conn = _open_connection(db_path, attach or {}, immutable=False)
+            _locked_databases.pop(db_path, None)
+        except sqlite3.OperationalError as e:
+            if "locked" not in str(e):
+                raise
+            debug(f"Opening {db_path.name} as immutable: {str(e)}")
+            _locked_databases[db_path] = time.monotonic()
+            conn = _open_connection(db_path, attach or {}, immutable=True)
 
     try:
-        # Copy the main database file and its auxiliary files (WAL, SHM)
-        for suffix in ["", "-wal", "-shm"]:
-            src_file = db_path.parent / f"{db_path.name}{suffix}"
-            if src_file.exists():
-                shutil.copy2(src_file, temp_dir_path / src_file.name)
-
-        # Connect to the copied database
-        temp_db_path = temp_dir_path / db_path.name
-        conn = sqlite3.connect(temp_db_path)
+        yield conn
+    finally:
+        conn.close()
 
-        try:
-            # Integrate possible changes in wal files
-            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
 
-            yield conn
-        finally:
-            conn.close()
-    finally:
-        # Clean up the temporary directory
-        shutil.rmtree(temp_dir, ignore_errors=True)
+# Largest icon of a bookmarked place, from the attached favicons database
+_FAVICON_SUBQUERY = """
+    (SELECT icon.data
+     FROM fav.moz_pages_w_icons page
+       JOIN fav.moz_icons_to_pages icon_to_page ON icon_to_page.page_id = page.id
+       JOIN fav.moz_icons icon ON icon.id = icon_to_page.icon_id
+     WHERE page.page_url_hash = place.url_hash
+     ORDER BY icon.width DESC
+     LIMIT 1)
+"""
 
 
-def get_bookmarks(places_db: Path) -> List[Tuple[str, str, str, str]]:
-    """Get all bookmarks from the places database"""
-    try:
-        with get_connection(places_db) as conn:
-            cursor = conn.cursor()
+def get_bookmarks(places_db: Path, favicons_db: Path) -> Iterator[Tuple[str, str, str, bytes | None]]:
+    """Yield all bookmarks from the places database along with their favicon data.
 
-            # Query bookmarks
-            cursor.execute("""
-                SELECT bookmark.guid, bookmark.title, place.url, place.url_hash
-                FROM moz_bookmarks bookmark
-                  JOIN moz_places place ON place.id = bookmark.fk
-                WHERE bookmark.type = 1 -- 1 = bookmark
-                  AND place.hidden = 0
-                  AND place.url IS NOT NULL
-            """)
+    If the favicons database cannot be read, bookmarks are yielded without favicons.
+    """
+    # Query bookmarks once per URL, picking the largest icon of each page.
+    # With a single MIN() aggregate, SQLite takes the bare columns from
+    # the row holding the minimum, so title and guid stay consistent.
+    query = """
+        SELECT MIN(bookmark.guid), bookmark.title, place.url, {icon_data} AS icon_data
+        FROM moz_bookmarks bookmark
+          JOIN moz_places place ON place.id = bookmark.fk
+        WHERE bookmark.type = 1 -- 1 = bookmark
+          AND place.hidden = 0
+          AND place.url IS NOT NULL
+        GROUP BY place.url
+    """
 
-            return cursor.fetchall()
+    try:
+        with ExitStack() as stack:
+            try:
+                conn = stack.enter_context(get_connection(places_db, attach={"fav": favicons_db}))
+                cursor = conn.execute(query.format(icon_data=_FAVICON_SUBQUERY))
+            except sqlite3.Error as e:
+                warning(f"Failed to read favicon data: {str(e)}")
+                stack.close()
+                conn = stack.enter_context(get_connection(places_db))
+                cursor = conn.execute(query.format(icon_data="NULL"))
+
+            yield from cursor
 
     except sqlite3.Error as e:
         critical(f"Failed to read Firefox bookmarks: {str(e)}")
-        return []
 
 
-def get_history(places_db: Path) -> List[Tuple[str, str, str]]:
-    """Get all history items from the places database"""
+def get_history(places_db: Path, page_size: int = 5000) -> Iterator[Tuple[str, str, str]]:
+    """Yield all history items from the places database.
+
+    :param places_db: Path to the places.sqlite database
+    :param page_size: Number of rows read per query, pages are keyed on the place id
+    """
     try:
         with get_connection(places_db) as conn:
             cursor = conn.cursor()
 
             # Query history excluding bookmarks
-            cursor.execute("""
-                SELECT place.guid, place.title, place.url
+            query = """
+                SELECT place.id, place.guid, place.title, place.url
                 FROM moz_places place
-                  LEFT JOIN moz_bookmarks bookmark ON place.id = bookmark.fk
                 WHERE place.hidden = 0
                   AND place.url IS NOT NULL
-                  AND bookmark.id IS NULL
-            """)
+                  AND place.id > :last_id
+                  AND NOT EXISTS (
+                    SELECT 1 FROM moz_bookmarks bookmark
+                    WHERE bookmark.fk = place.id AND bookmark.type = 1
+                  )
+                ORDER BY place.id
+                LIMIT :limit
+            """
 
-            return cursor.fetchall()
+            last_id = 0
+            while rows := cursor.execute(query, {"last_id": last_id, "limit": page_size}).fetchall():
+                for row in rows:
+                    yield row[1:]
+                last_id = rows[-1][0]
 
     except sqlite3.Error as e:
         critical(f"Failed to read Firefox history: {str(e)}")
-        return []
 
 
 def get_recent_history(places_db: Path, search: str = "", limit: int = 1000) -> List[Tuple[str, str, str]]:
@@ -151,11 +234,13 @@ def get_recent_history(places_db: Path, search: str = "", limit: int = 1000) ->
             query = f"""
                 SELECT place.guid, place.title, place.url
                 FROM moz_places place
-                  LEFT JOIN moz_bookmarks bookmark ON place.id = bookmark.fk
                 WHERE place.hidden = 0
                   AND place.url IS NOT NULL
                   AND place.last_visit_date IS NOT NULL
-                  AND bookmark.id IS NULL
+                  AND NOT EXISTS (
+                    SELECT 1 FROM moz_bookmarks bookmark
+                    WHERE bookmark.fk = place.id AND bookmark.type = 1
+                  )
                   AND {search_clause}
                 ORDER BY place.last_visit_date DESC
                 LIMIT :limit
@@ -169,25 +254,60 @@ def get_recent_history(places_db: Path, search: str = "", limit: int = 1000) ->
         return []
 
 
-def get_favicons_data(favicons_db: Path) -> dict[str, bytes]:
-    """Get all favicon data from the favicons database"""
+def _write_file_atomically(path: Path, data: bytes):
+    """Write data to path through a temporary file, so path is never left partially written"""
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
     try:
-        with get_connection(favicons_db) as conn:
-            cursor = conn.cursor()
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
 
-            # Query favicons
-            cursor.execute("""
-                SELECT moz_pages_w_icons.page_url_hash, moz_icons.data
-                FROM moz_icons
-                  INNER JOIN moz_icons_to_pages ON moz_icons.id = moz_icons_to_pages.icon_id
-                  INNER JOIN moz_pages_w_icons ON moz_icons_to_pages.page_id = moz_pages_w_icons.id
-            """)
 
-            return {row[0]: row[1] for row in cursor.fetchall()}
+def _file_size(path: Path) -> int | None:
+    """Return the size of the file at path, or None if it does not exist"""
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return None
 
-    except sqlite3.Error as e:
-        warning(f"Failed to read favicon data: {str(e)}")
-        return {}
+
+def _favicon_icon(icon_factory: Callable[[], Icon], favicon_path: Path) -> Icon:
+    """Compose the Firefox icon with a bookmark favicon"""
+    return Icon.composed(icon_factory(), Icon.iconified(Icon.image(favicon_path)), 1.0, .7)
+
+
+def _index_worker(handler_ref: weakref.ref, tasks: queue.Queue):
+    """Run the reindex requests queued by a FirefoxQueryHandler until it is gone.
+
+    Requests are True for a full reindex and False for history only, None stops
+    the worker. Only a weak reference is held while idle, so the handler can be
+    collected.
+    """
+    while (full := tasks.get()) is not None:
+        # Coalesce requests queued meanwhile, a full reindex covers a history one
+        while True:
+            try:
+                pending = tasks.get_nowait()
+            except queue.Empty:
+                break
+            if pending is None:
+                return
+            full = full or pending
+
+        handler = handler_ref()
+        if handler is None:
+            return
+        try:
+            if full:
+                handler._update_index_items_task()
+            else:
+                handler._update_history_index_items_task()
+        except Exception as e:
+            critical(f"Failed to update Firefox index: {str(e)}")
+        del handler
 
 
 class FirefoxQueryHandler(IndexQueryHandler):
@@ -207,13 +327,31 @@ class FirefoxQueryHandler(IndexQueryHandler):
         :param index_history: If true, history is also indexed
         """
         IndexQueryHandler.__init__(self)
-        self.thread = None
+        # guid -> (signature, IndexItem) of the last indexing run
+        self._bookmark_cache: Dict[str, Tuple[tuple, IndexItem]] = {}
+        self._history_cache: Dict[str, Tuple[tuple, IndexItem]] = {}
+        # Items of the last indexing run, None until bookmarks were indexed once
+        self._bookmark_items: List[IndexItem] | None = None
+        self._history_items: List[IndexItem] = []
 
         self.profile_path = profile_path
         self.icon_factory = icon_factory
         self.index_history = index_history
         self.plugin_data_location = data_location
 
+        # Shared by all items, built once instead of per item. The factories themselves
+        # cannot be replaced by prebuilt icons, each call has to return a new Icon.
+        self._no_favicon_icon_factory = lambda: Icon.composed(
+            self.icon_factory(), Icon.grapheme("🌐"), 1.0, .7)
+        self._history_icon_factory = lambda: Icon.composed(
+            self.icon_factory(), Icon.grapheme("🕘"), 1.0)
+
+        # A single worker runs all reindexing, requests never block the caller
+        self._tasks = queue.Queue()
+        # Builds history alongside the bookmarks during a full reindex
+        self._history_executor = ThreadPoolExecutor(max_workers=1)
+        threading.Thread(target=_index_worker, args=(weakref.ref(self), self._tasks), daemon=True).start()
+
     def id(self) -> str:
         """
         Returns the extension identifier.
@@ -233,85 +371,144 @@ class FirefoxQueryHandler(IndexQueryHandler):
         return md_description
 
     def __del__(self):
-        if self.thread and self.thread.is_alive():
-            self.thread.join()
+        self._tasks.put(None)
+        self._history_executor.shutdown(wait=False)
 
     def defaultTrigger(self):
         return "f "
 
     def updateIndexItems(self):
-        if self.thread and self.thread.is_alive():
-            self.thread.join()
-        self.thread = threading.Thread(target=self._update_index_items_task)
-        self.thread.start()
+        self._tasks.put(True)
+
+    def update_history_index_items(self):
+        """Reindex history only, reusing the indexed bookmarks"""
+        self._tasks.put(False)
 
     def _update_index_items_task(self):
         places_db = self.profile_path/ "places.sqlite"
         favicons_db = self.profile_path / "favicons.sqlite"
 
-        bookmarks = get_bookmarks(places_db)
-        info(f"Found {len(bookmarks)} bookmarks")
+        # History does not depend on the bookmarks, read it on a second connection meanwhile
+        history_future = None
+        if self.index_history:
+            history_future = self._history_executor.submit(self._build_history_items, places_db)
+        else:
+            self._history_cache = {}
 
-        favicons_location = self.plugin_data_location / "favicons"
-        favicons_location.mkdir(exist_ok=True, parents=True)
+        try:
+            first_run = self._bookmark_items is None
+            self._bookmark_items = self._build_bookmark_items(places_db, favicons_db)
+            if first_run and history_future:
+                # Nothing indexed yet, make bookmarks searchable while the usually much larger history is built
+                self.setIndexItems(self._bookmark_items)
+        finally:
+            # Never leave a history build running into the next reindex, without
+            # letting a history failure mask a bookmark one
+            if history_future:
+                wait([history_future])
+        self._history_items = history_future.result() if history_future else []
 
-        for f in favicons_location.glob("*"):
-            f.unlink()
+        self.setIndexItems(self._bookmark_items + self._history_items)
 
-        favicons = get_favicons_data(favicons_db)
+    def _update_history_index_items_task(self):
+        if self._bookmark_items is None:
+            self._update_index_items_task()
+            return
 
-        index_items = []
-        seen_urls = set()
+        if self.index_history:
+            self._history_items = self._build_history_items(self.profile_path / "places.sqlite")
+        else:
+            self._history_items = []
+            self._history_cache = {}
 
-        for guid, title, url, url_hash in bookmarks:
-            if url in seen_urls:
-                continue
-            seen_urls.add(url)
+        self.setIndexItems(self._bookmark_items + self._history_items)
+
+    def _build_bookmark_items(self, places_db: Path, favicons_db: Path) -> List[IndexItem]:
+        favicons_location = self.plugin_data_location / "favicons"
+        favicons_location.mkdir(exist_ok=True, parents=True)
 
-            favicon_data = favicons.get(url_hash)
+        index_items = []
+        item_cache = {}
+        favicon_files = {}
+
+        for guid, title, url, favicon_data in get_bookmarks(places_db, favicons_db):
+            favicon_path = None
             if favicon_data:
-                favicon_path = favicons_location / f"favicon_{guid}.png"
-                with open(favicon_path, "wb") as f:
-                    f.write(favicon_data)
-                icon_factory = lambda p=favicon_path: Icon.composed(
-                    self.icon_factory(), Icon.iconified(Icon.image(p)), 1.0, .7)
+                # Name favicons by content, identical icons are written once and kept across runs
+                favicon_hash = hashlib.blake2b(favicon_data, digest_size=8).hexdigest()
+                favicon_path = favicons_location / f"favicon_{favicon_hash}.png"
+                if _file_size(favicon_path) != len(favicon_data):
+                    favicon_files[favicon_path] = favicon_data
+
+            signature = (title, url, favicon_path)
+            cached = self._bookmark_cache.get(guid)
+            if cached and cached[0] == signature:
+                index_item = cached[1]
             else:
-                icon_factory = lambda: Icon.composed(
-                    self.icon_factory(), Icon.grapheme("🌐"), 1.0, .7)
+                if favicon_path:
+                    icon_factory = partial(_favicon_icon, self.icon_factory, favicon_path)
+                else:
+                    icon_factory = self._no_favicon_icon_factory
 
-            item = StandardItem(
-                id=guid,
-                text=title if title else url,
-                subtext=url,
-                icon_factory=icon_factory,
-                actions=[
-                    Action("open", "Open in Firefox", lambda u=url: openUrl(u)),
-                    Action("copy", "Copy URL", lambda u=url: setClipboardText(u)),
-                ],
-            )
-            index_items.append(IndexItem(item=item, string=f"{title} {url}".lower()))
+                item = StandardItem(
+                    id=guid,
+                    text=title if title else url,
+                    subtext=url,
+                    icon_factory=icon_factory,
+                    actions=[
+                        Action("open", "Open in Firefox", partial(openUrl, url)),
+                        Action("copy", "Copy URL", partial(setClipboardText, url)),
+                    ],
+                )
+                index_item = IndexItem(item=item, string=" ".join((title or "", url)).lower())
+            item_cache[guid] = (signature, index_item)
+            index_items.append(index_item)
 
-        if self.index_history:
-            history = get_history(places_db)
-            info(f"FirefoxQueryHandler: Found {len(history)} history items")
-            for guid, title, url in history:
-                if url in seen_urls:
-                    continue
-                seen_urls.add(url)
+        info(f"Found {len(index_items)} bookmarks")
+
+        # Icon.image only loads from a file path, so favicons have to go through the disk.
+        # Small file writes are I/O bound, overlap them
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(_write_file_atomically, favicon_files.keys(), favicon_files.values()))
+
+        # Remove favicons no longer used by any bookmark, and leftover temporary files
+        used_favicons = {signature[2].name for signature, _ in item_cache.values() if signature[2]}
+        with os.scandir(favicons_location) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name not in used_favicons:
+                    os.unlink(entry.path)
+
+        self._bookmark_cache = item_cache
+        return index_items
+
+    def _build_history_items(self, places_db: Path) -> List[IndexItem]:
+        index_items = []
+        item_cache = {}
+
+        for guid, title, url in get_history(places_db):
+            signature = (title, url)
+            cached = self._history_cache.get(guid)
+            if cached and cached[0] == signature:
+                index_item = cached[1]
+            else:
                 item = StandardItem(
                     id=guid,
                     text=title if title else url,
                     subtext=url,
-                    icon_factory=lambda: Icon.composed(
-                        self.icon_factory(), Icon.grapheme("🕘"), 1.0),
+                    icon_factory=self._history_icon_factory,
                     actions=[
-                        Action("open", "Open in Firefox", lambda u=url: openUrl(u)),
-                        Action("copy", "Copy URL", lambda u=url: setClipboardText(u)),
+                        Action("open", "Open in Firefox", partial(openUrl, url)),
+                        Action("copy", "Copy URL", partial(setClipboardText, url)),
                     ],
                 )
-                index_items.append(IndexItem(item=item, string=f"{title} {url}".lower()))
+                index_item = IndexItem(item=item, string=" ".join((title or "", url)).lower())
+            item_cache[guid] = (signature, index_item)
+            index_items.append(index_item)
 
-        self.setIndexItems(index_items)
+        info(f"FirefoxQueryHandler: Found {len(index_items)} history items")
+
+        self._history_cache = item_cache
+        return index_items
 
 
 class FirefoxHistoryHandler(GeneratorQueryHandler):
@@ -325,6 +522,8 @@ class FirefoxHistoryHandler(GeneratorQueryHandler):
         GeneratorQueryHandler.__init__(self)
         self.profile_path = profile_path
         self.icon_factory = icon_factory
+        self._history_icon_factory = lambda: Icon.composed(
+            self.icon_factory(), Icon.grapheme("🕘"), 1.0)
 
     def id(self) -> str:
         return md_name + "_history"
@@ -348,10 +547,10 @@ class FirefoxHistoryHandler(GeneratorQueryHandler):
                 id=guid,
                 text=title if title else url,
                 subtext=url,
-                icon_factory=lambda: Icon.composed(self.icon_factory(), Icon.grapheme("🕘"), 1.0),
+                icon_factory=self._history_icon_factory,
                 actions=[
-                    Action("open", "Open in Firefox", lambda u=url: openUrl(u)),
-                    Action("copy", "Copy URL", lambda u=url: setClipboardText(u)),
+                    Action("open", "Open in Firefox", partial(openUrl, url)),
+                    Action("copy", "Copy URL", partial(setClipboardText, url)),
                 ],
             )
 
@@ -440,9 +639,10 @@ class Plugin(PluginInstance):
     def index_history(self, value):
         self._index_history = value
         self.writeConfig("index_history", value)
-        # Ensure the query handler uses the updated history indexing setting
+        # Ensure the query handler uses the updated history indexing setting,
+        # bookmarks are unaffected so only history is reindexed
         self.handler.index_history = value
-        self.handler.updateIndexItems()
+        self.handler.update_history_index_items()
 
     def configWidget(self):
         return [